@@ -0,0 +1,80 @@
+import base64
+import os
+import threading
+from collections import OrderedDict
+
+
+# Default byte budget for encoded assets held in memory; override with ASSET_CACHE_BYTES
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class AssetCache:
+    """Process-wide LRU cache of base64-encoded files, keyed by path and mtime, bounded by bytes"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_base64(self, path):
+        """Base64 string for a file; raises OSError if it can't be read"""
+        key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return encoded
+            self.misses += 1
+
+        with open(path, 'rb') as f:
+            encoded = base64.b64encode(f.read()).decode()
+        self._store(key, encoded)
+        return encoded
+
+    def _store(self, key, encoded):
+        size = len(encoded)
+        if size > self.max_bytes:
+            # Too big to ever fit; serve it uncached
+            return
+
+        with self._lock:
+            # Drop stale versions of the same file
+            for stale in [k for k in self._entries if k[0] == key[0] and k != key]:
+                self._bytes -= len(self._entries.pop(stale))
+            if key in self._entries:
+                return
+
+            self._entries[key] = encoded
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def stats(self):
+        """Hit/miss counters and current memory use"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# Shared by both pages
+ASSET_CACHE = AssetCache(int(os.environ.get('ASSET_CACHE_BYTES', DEFAULT_MAX_BYTES)))
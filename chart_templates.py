@@ -0,0 +1,172 @@
+import threading
+
+import colors
+import lazy_import
+
+
+# Prebuilt plotly figure specs. Layout and static trace styling are built once at import;
+# a render only fills in the data arrays. Figures are plain dicts, which st.plotly_chart
+# accepts directly; prebuilt() turns one into a validated figure ahead of the request.
+# Shared between every figure: never mutate these.
+
+BAR_TRACE = {
+    'type': 'bar',
+    'orientation': 'h',
+    'marker': {
+        'colorscale': colors.GRADIENT_STOPS,
+        'cmin': 0,
+        'cmax': 100,
+        'line': {'color': 'rgba(1,1,1,1)', 'width': 2}
+    },
+    'textposition': 'outside',
+    'textfont': {'color': 'white', 'size': 12},
+    'hoverinfo': 'skip'
+}
+
+BAR_LAYOUT = {
+    'paper_bgcolor': "rgba(0,0,0,0)",
+    'plot_bgcolor': "rgba(0,0,0,0)",
+    'font': {'color': "white"},
+    'height': 260,
+    'margin': {'l': 10, 'r': 50, 't': 5, 'b': 5},
+    'xaxis': {
+        'showgrid': True,
+        'gridwidth': 1,
+        'gridcolor': 'rgba(255,255,255,0.1)',
+        'range': [0, 100],
+        'title': {'text': "Percentile Rank", 'font': {'color': 'white', 'size': 11}},
+        'tickfont': {'color': 'white', 'size': 10}
+    },
+    'yaxis': {
+        'showgrid': False,
+        'tickfont': {'color': 'white', 'size': 10}
+    },
+    'showlegend': False,
+    'bargap': 0.3
+}
+
+GAUGE_TRACE = {
+    'type': 'indicator',
+    'mode': "gauge+number",
+    'domain': {'x': [0, 1], 'y': [0, 1]},
+    'number': {'font': {'size': 12, 'color': 'white'}}
+}
+
+GAUGE_STYLE = {
+    'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "white"},
+    'bgcolor': "rgba(255,255,255,0.1)",
+    'borderwidth': 2,
+    'bordercolor': "rgba(255,255,255,0.3)",
+    'steps': colors.GAUGE_STEPS,
+    'threshold': {
+        'line': {'color': "white", 'width': 2},
+        'thickness': 0.75,
+        'value': 90
+    }
+}
+
+GAUGE_LAYOUT = {
+    'paper_bgcolor': "rgba(0,0,0,0)",
+    'plot_bgcolor': "rgba(0,0,0,0)",
+    'font': {'color': "white"},
+    'height': 100,
+    'margin': {'l': 5, 'r': 5, 't': 20, 'b': 5}
+}
+
+EMPTY_FIGURE = {'data': [], 'layout': {}}
+
+# Combined 2x2 section grid: gaps leave room for the right column's metric names
+# and for the top row's axis titles above the bottom row's subplot titles
+COMBINED_ROW_HEIGHT = 320
+COMBINED_SPACING = {'horizontal_spacing': 0.25, 'vertical_spacing': 0.18}
+
+# Grid layouts keyed by their subplot titles, built on first use
+_combined_layouts = {}
+_lock = threading.Lock()
+
+# Figure subclass for prebuilt(), defined on first use so plotly.graph_objects loads lazily
+_prebuilt_class = None
+
+
+def bar_figure(names, percentiles):
+    """Horizontal percentile bar chart, colored by percentile"""
+    trace = dict(BAR_TRACE, x=percentiles, y=names, text=[f"{perc:.0f}" for perc in percentiles])
+    trace['marker'] = dict(BAR_TRACE['marker'], color=percentiles)
+    return {'data': [trace], 'layout': BAR_LAYOUT}
+
+
+def combined_layout(titles):
+    """Layout for a 2x2 grid of bar charts with the given subplot titles (row by row)"""
+    titles = tuple(titles)
+    with _lock:
+        layout = _combined_layouts.get(titles)
+    if layout is not None:
+        return layout
+
+    # plotly.subplots is only needed to lay out the grid once
+    make_subplots = lazy_import.load('plotly.subplots').make_subplots
+    grid = make_subplots(rows=2, cols=2, subplot_titles=titles, **COMBINED_SPACING).to_plotly_json()['layout']
+
+    layout = {key: value for key, value in BAR_LAYOUT.items() if key not in ('xaxis', 'yaxis')}
+    layout['height'] = 2 * COMBINED_ROW_HEIGHT
+    layout['margin'] = dict(BAR_LAYOUT['margin'], t=30)
+    for i in range(1, 5):
+        suffix = '' if i == 1 else str(i)
+        layout[f'xaxis{suffix}'] = dict(BAR_LAYOUT['xaxis'], domain=grid[f'xaxis{suffix}']['domain'],
+                                        anchor=f'y{suffix}')
+        layout[f'yaxis{suffix}'] = dict(BAR_LAYOUT['yaxis'], domain=grid[f'yaxis{suffix}']['domain'],
+                                        anchor=f'x{suffix}')
+    layout['annotations'] = [
+        dict(annotation, font={'color': 'white', 'size': 14}) for annotation in grid['annotations']
+    ]
+
+    with _lock:
+        _combined_layouts[titles] = layout
+    return layout
+
+
+def combined_figure(titles, bars):
+    """One figure with a bar chart per section; bars is [(names, percentiles)] row by row"""
+    traces = []
+    for i, (names, percentiles) in enumerate(bars, start=1):
+        trace = bar_figure(names, percentiles)['data'][0]
+        suffix = '' if i == 1 else str(i)
+        trace['xaxis'] = f'x{suffix}'
+        trace['yaxis'] = f'y{suffix}'
+        traces.append(trace)
+    return {'data': traces, 'layout': combined_layout(titles)}
+
+
+def gauge_figure(value, title, bar_color):
+    """Section rating gauge"""
+    trace = dict(
+        GAUGE_TRACE,
+        value=value,
+        title={'text': title, 'font': {'size': 11, 'color': 'white'}},
+        gauge=dict(GAUGE_STYLE, bar={'color': bar_color})
+    )
+    return {'data': [trace], 'layout': GAUGE_LAYOUT}
+
+
+def prebuilt(spec):
+    """A figure spec validated now instead of on every draw
+
+    st.plotly_chart validates each dict it's given by building a plotly Figure from it,
+    several ms per chart, but only calls to_dict() on a Figure. The returned figure answers
+    to_dict() with the spec validated here, so drawing it is just the JSON dump.
+    Shared between sessions: never mutate it.
+    """
+    global _prebuilt_class
+    if _prebuilt_class is None:
+        go = lazy_import.load_plotly()
+
+        class PrebuiltFigure(go.Figure):
+            def __init__(self, spec):
+                super().__init__(spec)
+                self._spec = super().to_dict()
+
+            def to_dict(self):
+                return self._spec
+
+        _prebuilt_class = PrebuiltFigure
+    return _prebuilt_class(spec)
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+# Percentile color scales, precomputed for every integer percentile 0-100 so charts look
+# colors up by index instead of interpolating per value
+
+# Bar chart colorscale, also used for radar slices: (position 0-1, color)
+GRADIENT_STOPS = [[0, '#DC143C'], [0.25, '#FF6B35'], [0.5, '#FFD700'], [0.75, '#90EE90'], [1.0, '#32CD32']]
+
+# Standalone pizza_plot scale: (percentile, color), crimson -> orange -> yellow -> pale green -> dark green
+RAG_STOPS = [[0, '#DC143C'], [30, '#FF8C00'], [60, '#FFFF00'], [80, '#90EE90'], [100, '#006400']]
+
+# Quartile bands for stat cards and gauges: bottom quartile first
+QUARTILE_COLORS = ['#DC143C', '#FF6B35', '#FFD700', '#32CD32']
+
+# Faint quartile bands drawn behind the gauge needle
+GAUGE_STEPS = [
+    {'range': [0, 25], 'color': "rgba(220, 20, 60, 0.2)"},
+    {'range': [25, 50], 'color': "rgba(255, 107, 53, 0.2)"},
+    {'range': [50, 75], 'color': "rgba(255, 215, 0, 0.2)"},
+    {'range': [75, 100], 'color': "rgba(50, 205, 50, 0.2)"}
+]
+
+
+def hex_to_rgb(color):
+    return np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)])
+
+
+def _interpolate(x, stops):
+    """Linear interpolation between the two stops around x, truncated to a hex color"""
+    for (low, start), (high, end) in zip(stops, stops[1:]):
+        if x <= high:
+            break
+    intensity = (x - low) / (high - low)
+    start_color = hex_to_rgb(start)
+    color = start_color + (hex_to_rgb(end) - start_color) * intensity
+    return f"#{int(color[0]):02X}{int(color[1]):02X}{int(color[2]):02X}"
+
+
+def _quartile(percentile):
+    if percentile >= 75:
+        return QUARTILE_COLORS[3]
+    elif percentile >= 50:
+        return QUARTILE_COLORS[2]
+    elif percentile >= 25:
+        return QUARTILE_COLORS[1]
+    return QUARTILE_COLORS[0]
+
+
+# 101-entry lookup tables, index = percentile
+GRADIENT = np.array([_interpolate(p / 100.0, GRADIENT_STOPS) for p in range(101)])
+RAG = np.array([_interpolate(p, RAG_STOPS) for p in range(101)])
+QUARTILE = np.array([_quartile(p) for p in range(101)])
+
+
+def _index(percentiles):
+    """LUT positions for percentiles: floored, clipped to 0-100, NaN treated as 0"""
+    values = np.nan_to_num(np.asarray(percentiles, dtype=np.float64), nan=0.0)
+    return np.floor(values).clip(0, 100).astype(np.intp)
+
+
+def percentile_colors(percentiles, scale=GRADIENT):
+    """Hex colors for a whole array of percentiles in one lookup"""
+    return scale[_index(percentiles)].tolist()
+
+
+def percentile_color(percentile, scale=GRADIENT):
+    """Hex color for a single percentile"""
+    return str(scale[_index(percentile)])
+
+
+def rank_color(rank, total_teams=24, scale=QUARTILE):
+    """Color for a league rank (1st = top of the scale, last = bottom)"""
+    # Convert rank to percentile (1st = 100th percentile, last = 0th percentile)
+    return percentile_color(((total_teams - rank + 1) / total_teams) * 100, scale)
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
+
+
+# Cache key for a data file: cheap stat fields first, content hash to confirm a real change
+FileFingerprint = namedtuple('FileFingerprint', ['size', 'mtime_ns', 'sha1'])
+
+
+def file_fingerprint(path, previous=None):
+    """Fingerprint a file, reusing the previous hash when size and mtime are unchanged"""
+    stat = os.stat(path)
+    if previous is not None and (stat.st_size, stat.st_mtime_ns) == previous[:2]:
+        return previous
+
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return FileFingerprint(stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+
+
+class SnapshotCache:
+    """Holds the object built from a data file and hot-swaps it when the file changes
+
+    builder(path, version) is called with the content hash as the version. Rebuilds
+    happen on a background watcher thread, so requests keep reading the previous
+    snapshot until the new one is ready and is swapped in with a single assignment.
+    """
+
+    def __init__(self, path, builder, poll_interval=5.0):
+        self.path = path
+        self.builder = builder
+        self.poll_interval = poll_interval
+
+        self.fingerprint = None
+        self.snapshot = None
+        self.error = None
+
+        # Fingerprint of a file version that failed to build, so it isn't retried every poll
+        self._rejected = None
+
+        self._lock = threading.Lock()
+        self._watcher = None
+
+        # First build happens on the calling thread so the app has data to render
+        self.refresh()
+        self.start()
+
+    @property
+    def version(self):
+        return self.fingerprint.sha1 if self.fingerprint else None
+
+    def get(self):
+        """Current snapshot, or None if the file has never loaded successfully"""
+        return self.snapshot
+
+    def refresh(self):
+        """Rebuild the snapshot if the file content changed; returns True if it was swapped"""
+        with self._lock:
+            fingerprint = None
+            try:
+                fingerprint = file_fingerprint(self.path, self._rejected or self.fingerprint)
+                if fingerprint == self._rejected:
+                    return False
+                if self.fingerprint is not None and fingerprint.sha1 == self.fingerprint.sha1:
+                    # Touched but not modified: keep the snapshot, remember the new stat
+                    self.fingerprint = fingerprint
+                    self.error = None
+                    self._rejected = None
+                    return False
+
+                snapshot = self.builder(self.path, fingerprint.sha1)
+            except FileNotFoundError as e:
+                self.error = e
+                return False
+            except Exception as e:
+                # Keep serving the last good snapshot
+                self.error = e
+                self._rejected = fingerprint
+                if self.snapshot is not None:
+                    print(f"Keeping previous snapshot of {self.path}: {e}")
+                return False
+
+            self.snapshot = snapshot
+            self.fingerprint = fingerprint
+            self.error = None
+            self._rejected = None
+            print(f"Loaded snapshot of {self.path} (version {fingerprint.sha1[:12]})")
+            return True
+
+    def start(self):
+        """Start the background watcher if it isn't running"""
+        if self._watcher is None or not self._watcher.is_alive():
+            self._watcher = threading.Thread(
+                target=self._watch, name=f"snapshot-watcher:{self.path}", daemon=True
+            )
+            self._watcher.start()
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            self.refresh()
+
+
+class VersionedCache:
+    """Values derived from one data file, keyed freely and dropped when the file's version changes"""
+
+    def __init__(self):
+        self.version = None
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, version, key, build):
+        """Cached value for key under version, building it on a miss"""
+        with self._lock:
+            if version != self.version:
+                # New data: everything cached is stale
+                self.version = version
+                self._values.clear()
+            value = self._values.get(key)
+        if value is None:
+            value = build()
+            with self._lock:
+                if version == self.version:
+                    self._values[key] = value
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
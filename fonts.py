@@ -0,0 +1,95 @@
+"""Fonts for matplotlib radars, resolved from the bundled fonts/ directory.
+
+Usage:
+    python fonts.py --download   # fetch any missing font files into fonts/ (needs network)
+
+Rendering never touches the network unless FONTS_ALLOW_DOWNLOAD=1 is set; a font
+missing from fonts/ falls back to matplotlib's default sans-serif. The font files
+are committed with their licenses (fonts/LICENSE-*.txt).
+"""
+import argparse
+import os
+import threading
+import urllib.request
+
+import lazy_import
+
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+
+ROBOTO = ('Roboto-Regular.ttf',
+          'https://raw.githubusercontent.com/googlefonts/roboto/main/src/hinted/Roboto-Regular.ttf')
+
+# Font role -> bundled file name and where it was originally downloaded from.
+# Both roles use the bundled Roboto so every radar renders the same on every machine.
+FONTS = {
+    'title': ROBOTO,
+    'subtitle': ROBOTO,
+}
+
+FALLBACK_FAMILY = 'DejaVu Sans'
+
+# Font role -> FontProperties, loaded once per process
+_properties = {}
+_lock = threading.Lock()
+
+
+def download_allowed():
+    """Whether missing fonts may be fetched over the network (explicit opt-in only)"""
+    return os.environ.get('FONTS_ALLOW_DOWNLOAD') == '1'
+
+
+def download(role, font_dir=FONT_DIR):
+    """Fetch one font file into the font directory; returns its path"""
+    filename, url = FONTS[role]
+    path = os.path.join(font_dir, filename)
+    os.makedirs(font_dir, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with urllib.request.urlopen(url, timeout=30) as response, open(tmp_path, 'wb') as f:
+        f.write(response.read())
+    os.replace(tmp_path, path)
+    return path
+
+
+def font_path(role, font_dir=FONT_DIR):
+    """Local path of a font, downloading it only when allowed; None if unavailable"""
+    path = os.path.join(font_dir, FONTS[role][0])
+    if os.path.exists(path):
+        return path
+    if download_allowed():
+        try:
+            return download(role, font_dir)
+        except OSError as e:
+            print(f"Could not download font {FONTS[role][0]}: {e}")
+    return None
+
+
+def font_properties(role):
+    """matplotlib FontProperties for a font role, cached for the life of the process"""
+    with _lock:
+        properties = _properties.get(role)
+        if properties is not None:
+            return properties
+
+        FontProperties = lazy_import.load('matplotlib.font_manager').FontProperties
+        path = font_path(role)
+        if path is None:
+            print(f"Font {FONTS[role][0]} not found in {FONT_DIR}, using {FALLBACK_FAMILY}")
+            properties = FontProperties(family=FALLBACK_FAMILY)
+        else:
+            properties = FontProperties(fname=path)
+        _properties[role] = properties
+        return properties
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check or fetch the bundled radar fonts')
+    parser.add_argument('--download', action='store_true', help='download missing fonts into fonts/')
+    args = parser.parse_args()
+
+    for role, (filename, _) in FONTS.items():
+        path = os.path.join(FONT_DIR, filename)
+        if not os.path.exists(path) and args.download:
+            path = download(role)
+            print(f"Downloaded {filename}")
+        print(f"{role}: {path if os.path.exists(path) else 'missing'}")
@@ -0,0 +1,38 @@
+from html import escape
+from string import Template
+
+from data_cache import VersionedCache
+
+
+# Card markup, compiled once; styling lives in styles/app.css
+STAT_CARD = Template(
+    '<div class="stat-card">'
+    '<div class="stat-card-label">$label</div>'
+    '<div class="stat-card-value"$value_style>$value</div>'
+    '$detail'
+    '</div>'
+)
+STAT_CARD_DETAIL = Template('<div class="stat-card-detail"$style>$text</div>')
+
+
+def _color_style(color):
+    return f' style="color: {color};"' if color else ''
+
+
+def stat_card(label, value, value_color=None, detail=None, detail_color=None):
+    """Headline stat card: label, big value and an optional line underneath"""
+    detail_html = ''
+    if detail is not None:
+        detail_html = STAT_CARD_DETAIL.substitute(style=_color_style(detail_color),
+                                                  text=escape(str(detail), quote=False))
+    return STAT_CARD.substitute(
+        label=escape(label, quote=False),
+        value_style=_color_style(value_color),
+        value=escape(str(value), quote=False),
+        detail=detail_html
+    )
+
+
+# Rendered fragments per player, dropped when players.csv changes
+# (team pages cache whole views instead, see team_views.py)
+PLAYER_FRAGMENTS = VersionedCache()
@@ -0,0 +1,43 @@
+import importlib
+import importlib.util
+import sys
+import time
+
+
+# Seconds spent on the first import of each module loaded through this helper
+IMPORT_TIMES = {}
+
+
+def is_available(module_name):
+    """Whether a module can be imported, without paying for the import"""
+    if module_name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def load(module_name):
+    """Import a module on first use and record how long the import took"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    IMPORT_TIMES[module_name] = time.perf_counter() - start
+    print(f"Imported {module_name} in {IMPORT_TIMES[module_name] * 1000:.0f} ms")
+    return module
+
+
+def load_pyplot():
+    """matplotlib.pyplot with the non-interactive backend used for deployment"""
+    if 'matplotlib.pyplot' not in sys.modules:
+        load('matplotlib').use('Agg')
+    return load('matplotlib.pyplot')
+
+
+def load_plotly():
+    """plotly.graph_objects, loaded the first time a page draws a chart"""
+    return load('plotly.graph_objects')
@@ -0,0 +1,147 @@
+"""Build display-size variants of the logo and player images.
+
+Usage:
+    python logo_variants.py [--source .] [--out logos] [--sizes 48 160]
+
+Each PNG is resized to the given heights and written as optimized PNG and WebP,
+along with a manifest.json. At render time the pages pick the smallest variant
+tall enough for the slot, and fall back to the full-size PNG without a manifest.
+"""
+import argparse
+import glob
+import json
+import os
+
+from data_cache import file_fingerprint
+
+
+VARIANT_DIR = 'logos'
+MANIFEST_NAME = 'manifest.json'
+VARIANT_SIZES = (48, 160)
+
+MIME_TYPES = {'png': 'image/png', 'webp': 'image/webp'}
+
+
+def build_variants(source_dir='.', out_dir=VARIANT_DIR, sizes=VARIANT_SIZES):
+    """Resize every PNG in source_dir to each height and write the manifest"""
+    from PIL import Image
+
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {}
+
+    for source in sorted(glob.glob(os.path.join(source_dir, '*.png'))):
+        name = os.path.basename(source)
+        stem = os.path.splitext(name)[0]
+        variants = {}
+
+        with Image.open(source) as image:
+            image = image.convert('RGBA')
+            for size in sizes:
+                if size >= image.height:
+                    continue
+                width = max(1, round(image.width * size / image.height))
+                resized = image.resize((width, size), Image.LANCZOS)
+
+                files = {}
+                for fmt in ('png', 'webp'):
+                    filename = f'{stem}_{size}.{fmt}'
+                    path = os.path.join(out_dir, filename)
+                    if fmt == 'png':
+                        resized.save(path, 'PNG', optimize=True)
+                    else:
+                        resized.save(path, 'WEBP', quality=90, method=6)
+                    files[fmt] = {'file': filename, 'bytes': os.path.getsize(path)}
+
+                # Serve whichever format came out smaller
+                best = min(files, key=lambda fmt: files[fmt]['bytes'])
+                variants[str(size)] = {
+                    'width': width,
+                    'height': size,
+                    'files': files,
+                    'best': best
+                }
+
+        manifest[name] = {
+            'sha1': file_fingerprint(source).sha1,
+            'bytes': os.path.getsize(source),
+            'variants': variants
+        }
+
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+_manifest_cache = {}
+
+# (absolute path, mtime) -> content hash of a source image, so a rerun doesn't re-hash it
+_source_hashes = {}
+# Images already reported as newer than their variants
+_reported_stale = set()
+
+
+def load_manifest(out_dir=VARIANT_DIR):
+    """Variant manifest, read once per process; empty if the variants haven't been built"""
+    if out_dir not in _manifest_cache:
+        path = os.path.join(out_dir, MANIFEST_NAME)
+        manifest = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest = json.load(f)
+        _manifest_cache[out_dir] = manifest
+    return _manifest_cache[out_dir]
+
+
+def source_sha1(path):
+    """Content hash of a source image, or None if it can't be read"""
+    try:
+        key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    except OSError:
+        return None
+    sha1 = _source_hashes.get(key)
+    if sha1 is None:
+        sha1 = file_fingerprint(path).sha1
+        _source_hashes[key] = sha1
+    return sha1
+
+
+def best_variant(image_name, height, out_dir=VARIANT_DIR):
+    """(path, mime type) of the smallest variant at least `height` px tall, or None to use the original"""
+    entry = load_manifest(out_dir).get(os.path.basename(image_name))
+    if not entry:
+        return None
+
+    # Variants of a since-replaced image would show the old picture: use the new original
+    # (a deployment that ships only the variants has no source to compare against)
+    sha1 = source_sha1(image_name)
+    if sha1 is not None and sha1 != entry['sha1']:
+        if image_name not in _reported_stale:
+            _reported_stale.add(image_name)
+            print(f"{image_name} changed since its variants were built; "
+                  f"serving the original until logo_variants.py is rerun")
+        return None
+
+    fitting = sorted(int(size) for size in entry['variants'] if int(size) >= height)
+    if not fitting:
+        return None
+    variant = entry['variants'][str(fitting[0])]
+    fmt = variant['best']
+    return os.path.join(out_dir, variant['files'][fmt]['file']), MIME_TYPES[fmt]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build display-size logo variants')
+    parser.add_argument('--source', default='.', help='directory containing the source PNGs')
+    parser.add_argument('--out', default=VARIANT_DIR, help='output directory')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(VARIANT_SIZES), help='variant heights in px')
+    args = parser.parse_args()
+
+    manifest = build_variants(args.source, args.out, args.sizes)
+    original = sum(entry['bytes'] for entry in manifest.values())
+    for size in args.sizes:
+        total = sum(
+            entry['variants'][str(size)]['files'][entry['variants'][str(size)]['best']]['bytes']
+            for entry in manifest.values() if str(size) in entry['variants']
+        )
+        print(f"{size}px: {total / 1024:.0f} KB total vs {original / 1024:.0f} KB of originals")
+    print(f"Wrote {len(manifest)} images to {args.out}")
@@ -0,0 +1,68 @@
+from collections import namedtuple
+
+
+# Single source of truth for metric direction and derived-metric formulas.
+# Percentiles, league ranks and the headline cards all read from here.
+
+# Opponent stats describe what a team allows, so lower is better by default
+LOWER_IS_BETTER_PREFIXES = ('Oppo',)
+
+# Team stats (not opponent stats) where lower is better: giving the ball or shots away,
+# discipline, offsides and shooting from further out
+LOWER_IS_BETTER_METRICS = {
+    'PPDA',
+    'Total losses',
+    'Low losses',
+    'Med Losses',
+    'High losses',
+    'Conceded goals',
+    'Total shots against',
+    'SOT against',
+    'SOT against %',
+    'Offsides',
+    'Fouls',
+    'Yellow cards',
+    'Red cards',
+    'Average shot distance',
+}
+
+# Explicit overrides for metrics the rules above would get wrong: the opponent's side of
+# the team stats above, where more for the opponent is good for the team
+HIGHER_IS_BETTER_METRICS = {
+    'Oppo PPDA',
+    'Oppo Total losses',
+    'Oppo Low losses',
+    'Oppo Med Losses',
+    'Oppo High losses',
+    'Oppo Conceded goals',
+    'Oppo Total shots against',
+    'Oppo SOT against',
+    'Oppo SOT against %',
+    'Oppo Offsides',
+    'Oppo Fouls',
+    'Oppo Yellow cards',
+    'Oppo Red cards',
+    'Oppo Average shot distance',
+}
+
+# A metric computed from other columns; formula maps a column getter to a values array
+DerivedMetric = namedtuple('DerivedMetric', ['name', 'formula', 'lower_is_better'])
+
+XG_DIFFERENCE = 'xG difference'
+
+DERIVED_METRICS = {
+    XG_DIFFERENCE: DerivedMetric(
+        XG_DIFFERENCE,
+        lambda column: column('xG') - column('Oppo xG'),
+        False
+    ),
+}
+
+
+def is_lower_better(metric):
+    """Whether a lower value of this metric ranks a team higher"""
+    if metric in DERIVED_METRICS:
+        return DERIVED_METRICS[metric].lower_is_better
+    if metric in HIGHER_IS_BETTER_METRICS:
+        return False
+    return metric in LOWER_IS_BETTER_METRICS or metric.startswith(LOWER_IS_BETTER_PREFIXES)
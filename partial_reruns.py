@@ -0,0 +1,34 @@
+import functools
+import os
+import time
+
+import streamlit as st
+
+
+# Seconds the last run of each fragment took, for comparing partial and full reruns
+RENDER_TIMES = {}
+
+# PARTIAL_RERUNS=0 turns fragments back into plain functions (every interaction reruns the script)
+PARTIAL_RERUNS = os.environ.get('PARTIAL_RERUNS', '1') != '0'
+
+
+def _identity(func):
+    return func
+
+
+# st.fragment on current Streamlit, st.experimental_fragment on 1.33-1.36, full reruns before that
+_st_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or _identity
+
+
+def fragment(name):
+    """Rerun the decorated function on its own when a widget inside it changes, and time each run"""
+    def decorate(func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                RENDER_TIMES[name] = time.perf_counter() - start
+        return _st_fragment(timed) if PARTIAL_RERUNS else timed
+    return decorate
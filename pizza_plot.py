@@ -1,42 +1,10 @@
 import pandas as pd
 import matplotlib.pyplot as plt
-from mplsoccer import PyPizza, FontManager
+from mplsoccer import PyPizza
 import numpy as np
 
-def get_performance_color(value):
-    """Return a professional color based on performance value (0-100)."""
-    # Color scale: Dark green (high) -> Pale green -> Yellow -> Red (low)
-    # 80-100: Dark green to pale green (excellent performance)
-    # 60-79: Pale green to yellow (good to average performance)
-    # 30-59: Yellow to orange (below average performance)
-    # 0-29: Orange to red (poor performance)
-    
-    if value >= 80:
-        # Dark green to pale green (high performance)
-        intensity = (value - 80) / 20
-        pale_green = np.array([144, 238, 144])  # Light green
-        dark_green = np.array([0, 100, 0])      # Dark green
-        color = pale_green + (dark_green - pale_green) * intensity
-    elif value >= 60:
-        # Pale green to yellow (good to average)
-        intensity = (value - 60) / 20
-        yellow = np.array([255, 255, 0])        # Yellow
-        pale_green = np.array([144, 238, 144])  # Light green
-        color = yellow + (pale_green - yellow) * intensity
-    elif value >= 30:
-        # Yellow to orange (below average)
-        intensity = (value - 30) / 30
-        orange = np.array([255, 140, 0])        # Dark orange
-        yellow = np.array([255, 255, 0])        # Yellow
-        color = orange + (yellow - orange) * intensity
-    else:
-        # Orange to red (poor performance)
-        intensity = value / 30
-        red = np.array([220, 20, 60])           # Crimson
-        orange = np.array([255, 140, 0])        # Dark orange
-        color = red + (orange - red) * intensity
-    
-    return f"#{int(color[0]):02X}{int(color[1]):02X}{int(color[2]):02X}"
+import colors
+import fonts
 
 def plot_player(df, player_name, position_group, team_name):
     """
@@ -108,7 +76,7 @@ def plot_player(df, player_name, position_group, team_name):
               for col in selected_columns]
 
     # Create colors based on percentile values using professional red-amber-green scale
-    slice_colors = [get_performance_color(value) for value in formatted_values]
+    slice_colors = colors.percentile_colors(formatted_values, colors.RAG)
 
     # Create figure
     fig, ax = plt.subplots(figsize=(8, 8.5), subplot_kw=dict(polar=True))
@@ -142,11 +110,11 @@ def plot_player(df, player_name, position_group, team_name):
 
     # Add title and subtitle
     fig.text(0.515, 0.975, player_name, size=22, ha="center", 
-             fontproperties=FontManager('https://raw.githubusercontent.com/googlefonts/roboto/main/src/hinted/Roboto-Regular.ttf').prop, 
+             fontproperties=fonts.font_properties('title'), 
              color="#FFFFFF")
     
     fig.text(0.515, 0.933, f"{team_name} | 25/26 | {position_group}", size=18, ha="center", 
-             fontproperties=FontManager('https://raw.githubusercontent.com/google/fonts/main/apache/robotoslab/RobotoSlab[wght].ttf').prop, 
+             fontproperties=fonts.font_properties('subtitle'), 
              color="#FFFFFF")
 
     return fig
\ No newline at end of file
@@ -0,0 +1,74 @@
+import numpy as np
+
+import player_schema
+import snapshot
+
+
+class PercentileMatrix:
+    """Players x percentile-columns float32 matrix with (player_id, team) row and column indexes
+
+    When built from the snapshot the matrix is a read-only memory map, so every Streamlit
+    process on the box shares one physical copy through the OS page cache.
+    """
+
+    def __init__(self, matrix, player_ids, teams, columns):
+        self.matrix = matrix
+        self.columns = list(columns)
+        self.row_index = {(int(pid), team): i for i, (pid, team) in enumerate(zip(player_ids, teams))}
+        self.column_index = {col: j for j, col in enumerate(self.columns)}
+
+    @classmethod
+    def from_snapshot(cls, source_sha1, directory=snapshot.SNAPSHOT_DIR):
+        """Map the snapshot's percentile matrix, or None if there is no snapshot for this players.csv
+
+        The row index comes from the same manifest as the matrix file name, and snapshot
+        array files are never rewritten, so rows always line up with the mapped data.
+        """
+        section = snapshot.read_section(directory, 'players', source_sha1)
+        if section is None:
+            return None
+        group = section['groups'][player_schema.PERCENTILE]
+        player_ids = section['identity']['player_id']
+        try:
+            matrix = snapshot.load_array(directory, group['file'])
+        except OSError as e:
+            # Removed by a rebuild after the manifest was read
+            print(f"Could not map percentile snapshot: {e}")
+            return None
+        if matrix.shape != (len(player_ids), len(group['columns'])):
+            print(f"Ignoring percentile snapshot: matrix is {matrix.shape}, manifest expects "
+                  f"{(len(player_ids), len(group['columns']))}")
+            return None
+        return cls(matrix, player_ids, section['identity']['team_name'], group['columns'])
+
+    @classmethod
+    def from_frame(cls, df):
+        """In-memory matrix from a player frame that has the identity and percentile groups"""
+        columns = player_schema.project_columns(df.columns, (player_schema.PERCENTILE,))
+        matrix = df[columns].to_numpy(dtype=np.float32)
+        matrix.flags.writeable = False
+        return cls(matrix, df['player_id'].tolist(), df['team_name'].astype(str).tolist(), columns)
+
+    @classmethod
+    def load(cls, path, version):
+        """Snapshot-backed matrix when available, else parsed from the CSV"""
+        matrix = cls.from_snapshot(version)
+        if matrix is None:
+            groups = (player_schema.IDENTITY, player_schema.PERCENTILE)
+            matrix = cls.from_frame(player_schema.read_players(path, groups))
+        return matrix
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def has_player(self, player_id, team):
+        return (int(player_id), team) in self.row_index
+
+    def columns_for(self, columns):
+        """Column positions for a list of percentile column names"""
+        return [self.column_index[col] for col in columns]
+
+    def values(self, player_id, team, columns):
+        """One player's percentiles for the given columns, read straight from the matrix"""
+        row = self.row_index[(int(player_id), team)]
+        return self.matrix[row, self.columns_for(columns)]
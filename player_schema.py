@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+
+# Typed schema for players.csv, split into column groups so each view loads only what it needs
+
+IDENTITY_COLUMNS = [
+    'season_name', 'competition_name', 'team_id', 'team_name', 'player_id', 'player_name',
+    'birth_date', 'player_height', 'player_weight', 'position_group', 'formation',
+    'match_position', 'total_minutes'
+]
+
+# Low-cardinality text columns, stored as category codes
+CATEGORY_COLUMNS = ['season_name', 'competition_name', 'team_name', 'position_group']
+
+INTEGER_COLUMNS = ['team_id', 'player_id', 'formation']
+
+PER_90_SUFFIX = '_per_90'
+PERCENTILE_SUFFIX = '_percentile'
+
+IDENTITY = 'identity'
+PER_90 = 'per_90'
+PERCENTILE = 'percentile'
+ALL_GROUPS = (IDENTITY, PER_90, PERCENTILE)
+
+# What the recruitment page frame holds; radar percentiles come from the shared PercentileMatrix
+RECRUITMENT_GROUPS = (IDENTITY,)
+
+
+def column_group(column):
+    """Which column group a players.csv column belongs to"""
+    if column.endswith(PERCENTILE_SUFFIX):
+        return PERCENTILE
+    if column.endswith(PER_90_SUFFIX):
+        return PER_90
+    return IDENTITY
+
+
+def project_columns(columns, groups=ALL_GROUPS):
+    """Columns (in file order) that belong to the requested groups"""
+    return [col for col in columns if column_group(col) in groups]
+
+
+def column_dtype(column):
+    """Compact dtype for a players.csv column"""
+    if column in CATEGORY_COLUMNS:
+        return 'category'
+    if column in INTEGER_COLUMNS:
+        return np.int32
+    if column in IDENTITY_COLUMNS:
+        # Free text (names, dates, match position) stays as strings
+        if column in ('player_name', 'birth_date', 'match_position'):
+            return str
+        return np.float32
+    return np.float32
+
+
+def read_players(path, groups=ALL_GROUPS):
+    """Read only the requested column groups of players.csv, already in compact dtypes"""
+    header = pd.read_csv(path, nrows=0).columns
+    columns = project_columns(header, groups)
+    return pd.read_csv(path, usecols=columns, dtype={col: column_dtype(col) for col in columns})[columns]
+
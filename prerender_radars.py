@@ -0,0 +1,114 @@
+"""Render player radars ahead of time into the radar cache.
+
+Usage:
+    python prerender_radars.py [--players players.csv] [--workers 4]
+                               [--competition NAME] [--team NAME] [--position NAME]
+                               [--backend matplotlib|svg]
+
+Radars already in the cache for the current players.csv are skipped, so an
+interrupted run picks up where it stopped. Run it after each data drop and the
+app serves every radar from the cache instead of rendering on the request path.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import player_schema
+import radar_render
+import snapshot
+from data_cache import file_fingerprint
+from player_percentiles import PercentileMatrix
+from radar_cache import RADAR_CACHE, RadarCache, radar_key
+
+
+# Per-worker cache, set up once by the pool initializer
+_worker_cache = None
+
+
+def _init_worker(directory, version):
+    global _worker_cache
+    # Workers only write; keeping renders in memory would just grow each process
+    _worker_cache = RadarCache(directory, max_memory_bytes=0)
+    _worker_cache.version = version
+
+
+def _render(key, params, values, backend):
+    """Render one radar in a worker and store it; returns the image size"""
+    image, fmt = radar_render.render(params, values, backend)
+    _worker_cache.put(key, image, fmt)
+    return len(image)
+
+
+def radar_jobs(df, matrix, cache, backend=radar_render.BACKEND):
+    """(key, params, values, backend) for every player in df whose radar is not cached yet"""
+    fmt = radar_render.FORMATS[backend]
+    jobs = {}
+    for player_id, team_name, position_group in zip(df['player_id'], df['team_name'], df['position_group']):
+        if not matrix.has_player(player_id, team_name):
+            continue
+        columns = radar_render.radar_columns(position_group)
+        values = radar_render.format_values(matrix.values(player_id, team_name, columns))
+        key = radar_key(player_id, columns, values, radar_render.STYLE_PRESET, radar_render.DPI, fmt)
+        if key not in jobs and not cache.contains(key, fmt):
+            jobs[key] = (radar_render.radar_params(columns), values)
+    return [(key, params, values, backend) for key, (params, values) in jobs.items()]
+
+
+def prerender(players_csv, workers=None, competition=None, team=None, position=None,
+              backend=radar_render.BACKEND, cache=RADAR_CACHE):
+    """Render every matching radar that isn't cached; returns (rendered, skipped, failed)"""
+    version = file_fingerprint(players_csv).sha1
+    cache.set_version(version)
+
+    df = snapshot.load_players(version, (player_schema.IDENTITY,))
+    if df is None:
+        df = player_schema.read_players(players_csv, (player_schema.IDENTITY,))
+    if competition:
+        df = df[df['competition_name'] == competition]
+    if team:
+        df = df[df['team_name'] == team]
+    if position:
+        df = df[df['position_group'] == position]
+
+    matrix = PercentileMatrix.load(players_csv, version)
+    jobs = radar_jobs(df, matrix, cache, backend)
+    skipped = len(df) - len(jobs)
+    print(f"{len(df)} players selected, {len(jobs)} radars to render ({skipped} cached or duplicate)")
+    if not jobs:
+        return 0, skipped, 0
+
+    rendered = failed = total_bytes = 0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache.directory, version)) as pool:
+        futures = {pool.submit(_render, *job): job[0] for job in jobs}
+        for future in as_completed(futures):
+            try:
+                total_bytes += future.result()
+                rendered += 1
+            except Exception as e:
+                failed += 1
+                print(f"\nFailed to render radar {futures[future][:12]}: {e}")
+            done = rendered + failed
+            elapsed = time.perf_counter() - started
+            print(f"\r{done}/{len(jobs)} rendered in {elapsed:.0f}s "
+                  f"({done / elapsed:.1f}/s, {total_bytes / 1024 / 1024:.0f} MB)", end='', flush=True)
+    print()
+    return rendered, skipped, failed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Prerender player radars into the radar cache')
+    parser.add_argument('--players', default='players.csv', help='player stats CSV')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='render processes')
+    parser.add_argument('--competition', help='only players in this competition')
+    parser.add_argument('--team', help='only players of this team')
+    parser.add_argument('--position', help='only players in this position group')
+    parser.add_argument('--backend', choices=radar_render.BACKENDS, default=radar_render.BACKEND,
+                        help='radar renderer (defaults to RADAR_BACKEND)')
+    args = parser.parse_args()
+
+    rendered, skipped, failed = prerender(args.players, args.workers, args.competition, args.team,
+                                          args.position, args.backend)
+    print(f"Rendered {rendered}, skipped {skipped}, failed {failed} into {RADAR_CACHE.directory}")
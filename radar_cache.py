@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+import static_assets
+
+
+RADAR_CACHE_DIR = 'radar_cache'
+# Radars published for static serving are named radar_<version>.<hash>.<fmt>
+PUBLISHED_PREFIX = 'radar'
+DEFAULT_MAX_MEMORY_BYTES = 16 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+def radar_key(player_id, columns, values, style, dpi, fmt='png'):
+    """Content address of a radar render: everything that changes the output image"""
+    payload = json.dumps({
+        'player_id': int(player_id),
+        'columns': list(columns),
+        'values': [int(v) for v in values],
+        'style': style,
+        'dpi': dpi,
+        'format': fmt
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class RadarCache:
+    """Rendered radar images cached in memory (LRU) and on disk, both bounded by bytes
+
+    Entries live under the data version they were rendered from; switching to a new
+    version drops the old version's entries from memory and disk, along with radars
+    published to the static directory under another version.
+    """
+
+    def __init__(self, directory=RADAR_CACHE_DIR, max_memory_bytes=DEFAULT_MAX_MEMORY_BYTES,
+                 max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        self.version = None
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _version_dir(self):
+        return os.path.join(self.directory, self.version[:16])
+
+    def _path(self, key, fmt):
+        return os.path.join(self._version_dir(), f'{key}.{fmt}')
+
+    def published_name(self, fmt):
+        """Name to publish a radar of the current version under, so set_version can prune it"""
+        return f'{PUBLISHED_PREFIX}_{self.version[:16]}.{fmt}'
+
+    def set_version(self, version):
+        """Switch to a data version, invalidating renders from any other version"""
+        if version == self.version:
+            return
+        with self._lock:
+            self.version = version
+            self._memory.clear()
+            self._memory_bytes = 0
+        if version is None:
+            return
+        static_assets.prune(PUBLISHED_PREFIX, f'{PUBLISHED_PREFIX}_{version[:16]}.')
+        if not os.path.isdir(self.directory):
+            return
+        current = os.path.basename(self._version_dir())
+        for name in os.listdir(self.directory):
+            if name != current:
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def get(self, key, fmt='png'):
+        """Cached image bytes, or None"""
+        if self.version is None:
+            return None
+
+        with self._lock:
+            data = self._memory.get((key, fmt))
+            if data is not None:
+                self._memory.move_to_end((key, fmt))
+                self.hits += 1
+                return data
+
+        path = self._path(key, fmt)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        # Touch so disk eviction sees it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.disk_hits += 1
+        self._remember(key, fmt, data)
+        return data
+
+    def put(self, key, data, fmt='png'):
+        """Store a render in memory and on disk"""
+        if self.version is None:
+            return
+        self._remember(key, fmt, data)
+
+        path = self._path(key, fmt)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._evict_disk()
+        except OSError as e:
+            print(f"Could not write radar cache entry {path}: {e}")
+
+    def contains(self, key, fmt='png'):
+        """Whether a render is cached, without loading it"""
+        if self.version is None:
+            return False
+        with self._lock:
+            if (key, fmt) in self._memory:
+                return True
+        return os.path.exists(self._path(key, fmt))
+
+    def _remember(self, key, fmt, data):
+        if len(data) > self.max_memory_bytes:
+            return
+        with self._lock:
+            if (key, fmt) in self._memory:
+                return
+            self._memory[(key, fmt)] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _evict_disk(self):
+        """Delete least recently used files until the version directory fits the disk budget"""
+        directory = self._version_dir()
+        entries = []
+        total = 0
+        for name in os.listdir(directory):
+            if name.endswith('.tmp'):
+                continue
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except OSError:
+                # Removed by another process between listdir and stat
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+        if total <= self.max_disk_bytes:
+            return
+        for _, size, name in sorted(entries):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes
+            }
+
+
+# Shared by every session in the process
+RADAR_CACHE = RadarCache(
+    os.environ.get('RADAR_CACHE_DIR', RADAR_CACHE_DIR),
+    max_disk_bytes=int(os.environ.get('RADAR_CACHE_BYTES', DEFAULT_MAX_DISK_BYTES))
+)
@@ -0,0 +1,200 @@
+import io
+import math
+import os
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+import colors
+import lazy_import
+
+
+# Position-specific percentile columns for radar plots
+POSITION_COLUMNS = {
+    'Full Back': [
+        "obv_defensive_action_percentile", "dribbled_past_percentile", "successful_crosses_percentile",
+        "op_xa_percentile", "obv_pass_percentile", "dribbles_percentile",
+        "obv_dribble_carry_percentile"
+    ],
+    'Central Midfield': [
+        "aggressive_actions_percentile", "ball_recoveries_percentile", "obv_defensive_action_percentile",
+        "deep_progressions_percentile", "successful_long_balls_percentile", "obv_pass_percentile",
+        "op_xa_percentile", "through_balls_percentile", "obv_dribble_carry_percentile", "np_xg_percentile"
+    ]
+}
+
+# Fall back DEFAULT columns if position not found
+DEFAULT_COLUMNS = [
+    "tackles_percentile", "interceptions_percentile", "dribbles_percentile",
+    "key_passes_percentile", "xa_percentile", "np_xg_percentile",
+    "passes_percentile", "successful_passes_percentile", "aerials_percentile",
+    "ball_recoveries_percentile"
+]
+
+# Create readable parameter names
+PARAM_NAMES = {
+    "aggressive_actions_percentile": "Aggressive Actions",
+    "ball_recoveries_percentile": "Ball Recoveries",
+    "obv_defensive_action_percentile": "Defensive OBV",
+    "deep_progressions_percentile": "Deep Progressions",
+    "successful_long_balls_percentile": "Successful Long Balls",
+    "obv_pass_percentile": "Pass OBV",
+    "op_xa_percentile": "OP xA",
+    "through_balls_percentile": "Through Balls",
+    "obv_dribble_carry_percentile": "Dribble OBV",
+    "np_xg_percentile": "Non-pen xG"
+}
+
+# Identifies the look of the renders below; change it whenever the styling changes
+STYLE_PRESET = 'pizza-dark-v1'
+DPI = 150
+
+# 'matplotlib' draws a PNG on the server; 'svg' sends a few KB of vector markup the browser draws
+BACKENDS = ('matplotlib', 'svg')
+BACKEND = os.environ.get('RADAR_BACKEND', 'matplotlib')
+if BACKEND not in BACKENDS:
+    print(f"Unknown RADAR_BACKEND {BACKEND!r}, using matplotlib")
+    BACKEND = 'matplotlib'
+
+# Image format and MIME type each backend produces
+FORMATS = {'matplotlib': 'png', 'svg': 'svg'}
+MIME_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+# Middle color of the main page background gradient
+BG_COLOR = "#1a1a2e"
+
+
+def radar_columns(position_group):
+    """Percentile columns shown on the radar for a position group"""
+    return POSITION_COLUMNS.get(position_group, DEFAULT_COLUMNS)
+
+
+def radar_params(columns):
+    """Readable slice labels for percentile columns"""
+    return [PARAM_NAMES.get(col, col.replace('_percentile', '').replace('_', ' ').title())
+            for col in columns]
+
+
+def format_values(values):
+    """Round percentiles to the integers drawn on the radar; missing values become 0"""
+    return [int(round(v)) if not np.isnan(v) else 0 for v in values]
+
+
+def render_pizza_png(params, formatted_values, dpi=DPI):
+    """Draw the pizza radar with matplotlib/mplsoccer and return PNG bytes"""
+    # Load the plotting stack on first use
+    plt = lazy_import.load_pyplot()
+    PyPizza = lazy_import.load('mplsoccer').PyPizza
+
+    # Create performance colors for slice values
+    slice_colors = colors.percentile_colors(formatted_values)
+
+    fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
+    fig.patch.set_facecolor(BG_COLOR)
+
+    # Create pizza plot with smaller inner circle
+    baker = PyPizza(
+        params=params,
+        background_color="#1a1a1a",  # Darker background
+        straight_line_color="#ffffff",
+        straight_line_lw=0,
+        last_circle_lw=5,
+        other_circle_lw=1,
+        inner_circle_size=0  # Much smaller inner circle
+    )
+
+    baker.make_pizza(
+        formatted_values,
+        ax=ax,
+        color_blank_space=["#1a1a1a"] * len(params),
+        slice_colors=slice_colors,  # Performance colors for slices
+        value_colors=["#FFFFFF"] * len(params),
+        value_bck_colors=["#1a1a1a"] * len(params),  # Match darker background
+        blank_alpha=0.98,  # Higher alpha for darker background
+        kwargs_slices=dict(edgecolor="#000000", zorder=2, linewidth=2),
+        kwargs_params=dict(color="#FFFFFF", fontsize=12, va="center"),
+        kwargs_values=dict(color="#FFFFFF", fontsize=12, zorder=3,
+                           bbox=dict(edgecolor="#FFFFFF", facecolor="#2b2b2b",
+                                     boxstyle="round,pad=0.2", lw=2))
+    )
+
+    # Render to PNG with main page background
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format='png', facecolor=BG_COLOR, edgecolor='none',
+                    bbox_inches='tight', dpi=dpi, transparent=False, pad_inches=0)
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+def render_pizza_svg(params, formatted_values):
+    """Draw the same pizza design as SVG markup and return it as UTF-8 bytes"""
+    # Wider than tall so the longest labels fit beside the ring
+    width, height = 820, 600
+    cx, cy = width / 2, height / 2
+    radius = 230
+
+    def point(r, angle):
+        return cx + r * math.cos(angle), cy + r * math.sin(angle)
+
+    def wedge(r, start, end):
+        x1, y1 = point(r, start)
+        x2, y2 = point(r, end)
+        large_arc = 1 if end - start > math.pi else 0
+        return (f'<path d="M{cx:.1f},{cy:.1f} L{x1:.1f},{y1:.1f} '
+                f'A{r:.1f},{r:.1f} 0 {large_arc} 1 {x2:.1f},{y2:.1f} Z"')
+
+    step = 2 * math.pi / len(params)
+    # First slice starts at the top and slices run clockwise
+    angles = [-math.pi / 2 + i * step for i in range(len(params))]
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'font-family="DejaVu Sans, Arial, sans-serif">',
+        f'<rect width="{width}" height="{height}" fill="{BG_COLOR}"/>',
+        f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="#1a1a1a"/>'
+    ]
+
+    # Blank space behind each slice, then the slice itself scaled by its percentile
+    slice_colors = colors.percentile_colors(formatted_values)
+    for angle, value, color in zip(angles, formatted_values, slice_colors):
+        parts.append(wedge(radius, angle, angle + step) + ' fill="#1a1a1a" fill-opacity="0.98" '
+                     'stroke="#000000" stroke-width="2"/>')
+        if value > 0:
+            parts.append(wedge(radius * value / 100, angle, angle + step) +
+                         f' fill="{color}" stroke="#000000" stroke-width="2"/>')
+
+    # Dashed reference circles every 20 percentiles and a heavy outer ring
+    for pct in (20, 40, 60, 80):
+        parts.append(f'<circle cx="{cx}" cy="{cy}" r="{radius * pct / 100:.1f}" fill="none" '
+                     f'stroke="#808080" stroke-width="1" stroke-dasharray="4 4"/>')
+    parts.append(f'<circle cx="{cx}" cy="{cy}" r="{radius}" fill="none" '
+                 f'stroke="#000000" stroke-width="5"/>')
+
+    for angle, label, value in zip(angles, params, formatted_values):
+        middle = angle + step / 2
+
+        # Parameter label just outside the ring
+        x, y = point(radius * 1.08, middle)
+        anchor = 'middle' if abs(x - cx) < 10 else ('start' if x > cx else 'end')
+        parts.append(f'<text x="{x:.1f}" y="{y:.1f}" fill="#FFFFFF" font-size="13" '
+                     f'text-anchor="{anchor}" dominant-baseline="middle">{escape(label)}</text>')
+
+        # Value box at the end of the slice
+        x, y = point(radius * max(value, 12) / 100, middle)
+        box_width = 10 + 8 * len(str(value))
+        parts.append(f'<rect x="{x - box_width / 2:.1f}" y="{y - 11:.1f}" width="{box_width}" height="22" rx="5" '
+                     f'fill="#2b2b2b" stroke="#FFFFFF" stroke-width="2"/>')
+        parts.append(f'<text x="{x:.1f}" y="{y:.1f}" fill="#FFFFFF" font-size="13" '
+                     f'text-anchor="middle" dominant-baseline="central">{value}</text>')
+
+    parts.append('</svg>')
+    return ''.join(parts).encode()
+
+
+def render(params, formatted_values, backend=BACKEND):
+    """Render a radar with the given backend; returns (image bytes, format)"""
+    if backend == 'svg':
+        return render_pizza_svg(params, formatted_values), FORMATS[backend]
+    return render_pizza_png(params, formatted_values), FORMATS[backend]
@@ -0,0 +1,239 @@
+"""Compile leagueone.csv and players.csv into a binary snapshot the app can memory-map.
+
+Usage:
+    python snapshot.py [--teams leagueone.csv] [--players players.csv] [--out snapshot]
+
+The snapshot is a directory of .npy arrays plus a manifest.json that records the
+content hash of each source CSV. The app only uses a section of the snapshot when
+that hash matches the CSV on disk, and falls back to parsing the CSV otherwise.
+The team section also records each metric's direction from metric_registry, since
+its percentiles and ranks depend on it, and is ignored once the registry changes.
+
+Array files are named by their content and never rewritten: running processes keep
+their memory maps of the previous build while a rebuild adds new files, and the
+manifest only points at the new files once they are complete.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+import player_schema
+from data_cache import file_fingerprint
+from metric_registry import is_lower_better
+from team_store import TeamStore
+
+
+SNAPSHOT_DIR = 'snapshot'
+MANIFEST_NAME = 'manifest.json'
+FORMAT_VERSION = 2
+
+
+def read_manifest(directory=SNAPSHOT_DIR):
+    """Parsed manifest, or None if there is no snapshot"""
+    path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def read_section(directory, name, source_sha1):
+    """Manifest section for one dataset if it was built from the given source content"""
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return None
+    section = manifest.get(name)
+    if section is None or section['source']['sha1'] != source_sha1:
+        return None
+    return section
+
+
+def load_array(directory, filename):
+    """Memory-map one of the snapshot's .npy arrays read-only"""
+    return np.load(os.path.join(directory, filename), mmap_mode='r')
+
+
+def save_array(directory, stem, array):
+    """Write an array as <stem>.<content hash>.npy and return the file name
+
+    An existing file of that name already holds these exact bytes, so it is left alone.
+    """
+    array = np.ascontiguousarray(array)
+    digest = hashlib.sha1(f'{array.dtype.str}{array.shape}'.encode())
+    digest.update(array.tobytes())
+    filename = f'{stem}.{digest.hexdigest()[:16]}.npy'
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, array)
+        os.replace(tmp_path, path)
+    return filename
+
+
+def manifest_files(manifest):
+    """Array file names the manifest refers to"""
+    files = set()
+    if 'teams' in manifest:
+        files.update(manifest['teams']['files'].values())
+    if 'players' in manifest:
+        files.update(group['file'] for group in manifest['players']['groups'].values())
+    return files
+
+
+def remove_unreferenced(directory, manifest):
+    """Delete array files from earlier builds
+
+    Processes that still have one mapped keep reading it (the data stays until the map is
+    closed); a process that read the old manifest but hasn't mapped yet gets OSError and
+    falls back to the CSV.
+    """
+    keep = manifest_files(manifest)
+    for path in glob.glob(os.path.join(directory, '*.npy')):
+        if os.path.basename(path) not in keep:
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Could not remove old snapshot file {path}: {e}")
+
+
+def build_team_section(csv_path, directory):
+    """Write the team value, percentile and rank matrices; returns the manifest section"""
+    fingerprint = file_fingerprint(csv_path)
+    store = TeamStore.from_dataframe(pd.read_csv(csv_path), version=fingerprint.sha1)
+
+    files = {
+        'values': save_array(directory, 'teams_values', store.values),
+        'percentiles': save_array(directory, 'teams_percentiles', store.percentiles),
+        'ranks': save_array(directory, 'teams_ranks', store.ranks)
+    }
+
+    return {
+        'source': {'path': csv_path, 'size': fingerprint.size, 'sha1': fingerprint.sha1},
+        'teams': store.teams,
+        'metrics': store.metrics,
+        'lower_is_better': [is_lower_better(m) for m in store.metrics],
+        'files': files
+    }
+
+
+def build_player_section(csv_path, directory):
+    """Write each numeric player column group as a float32 matrix; identity columns go in the manifest"""
+    fingerprint = file_fingerprint(csv_path)
+    df = player_schema.read_players(csv_path)
+    columns = df.columns.tolist()
+
+    groups = {}
+    for group in (player_schema.PER_90, player_schema.PERCENTILE):
+        group_columns = player_schema.project_columns(columns, (group,))
+        filename = save_array(directory, f'players_{group}', df[group_columns].to_numpy(dtype=np.float32))
+        groups[group] = {'columns': group_columns, 'file': filename}
+
+    identity_columns = player_schema.project_columns(columns, (player_schema.IDENTITY,))
+    identity = {col: df[col].astype(object).tolist() for col in identity_columns}
+
+    return {
+        'source': {'path': csv_path, 'size': fingerprint.size, 'sha1': fingerprint.sha1},
+        'columns': columns,
+        'identity': identity,
+        'groups': groups
+    }
+
+
+def build_snapshot(teams_csv='leagueone.csv', players_csv='players.csv', directory=SNAPSHOT_DIR):
+    """Build both sections and write the manifest last, so a partial build is never picked up"""
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    manifest = {'format_version': FORMAT_VERSION}
+    if os.path.exists(teams_csv):
+        manifest['teams'] = build_team_section(teams_csv, directory)
+    if os.path.exists(players_csv):
+        manifest['players'] = build_player_section(players_csv, directory)
+
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+    remove_unreferenced(directory, manifest)
+    return manifest
+
+
+def load_team_store(source_sha1, directory=SNAPSHOT_DIR):
+    """TeamStore backed by memory-mapped snapshot arrays, or None if there is no matching snapshot"""
+    section = read_section(directory, 'teams', source_sha1)
+    if section is None:
+        return None
+    if section.get('lower_is_better') != [is_lower_better(m) for m in section['metrics']]:
+        # Percentiles and ranks were computed with different metric directions
+        print("Ignoring team snapshot: metric directions changed since it was built")
+        return None
+    files = section['files']
+    try:
+        values, percentiles, ranks = (load_array(directory, files[name])
+                                      for name in ('values', 'percentiles', 'ranks'))
+    except OSError as e:
+        # Removed by a rebuild after the manifest was read
+        print(f"Could not map team snapshot: {e}")
+        return None
+    return TeamStore(
+        section['teams'],
+        section['metrics'],
+        values,
+        version=source_sha1,
+        percentiles=percentiles,
+        ranks=ranks
+    )
+
+
+def load_players(source_sha1, groups=player_schema.ALL_GROUPS, directory=SNAPSHOT_DIR):
+    """Player DataFrame for the requested column groups, numeric groups on memory-mapped matrices
+
+    Returns None if there is no snapshot built from this players.csv content.
+    """
+    section = read_section(directory, 'players', source_sha1)
+    if section is None:
+        return None
+
+    frames = []
+    if player_schema.IDENTITY in groups:
+        identity = pd.DataFrame(section['identity'])
+        frames.append(identity.astype({col: player_schema.column_dtype(col) for col in identity.columns}))
+    for group in (player_schema.PER_90, player_schema.PERCENTILE):
+        if group in groups:
+            try:
+                matrix = load_array(directory, section['groups'][group]['file'])
+            except OSError as e:
+                # Removed by a rebuild after the manifest was read
+                print(f"Could not map player snapshot: {e}")
+                return None
+            frames.append(pd.DataFrame(matrix, columns=section['groups'][group]['columns'], copy=False))
+
+    df = pd.concat(frames, axis=1)
+    return df[player_schema.project_columns(section['columns'], groups)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the binary data snapshot for the dashboard')
+    parser.add_argument('--teams', default='leagueone.csv', help='team stats CSV')
+    parser.add_argument('--players', default='players.csv', help='player stats CSV')
+    parser.add_argument('--out', default=SNAPSHOT_DIR, help='snapshot directory')
+    args = parser.parse_args()
+
+    manifest = build_snapshot(args.teams, args.players, args.out)
+    for name in ('teams', 'players'):
+        if name in manifest:
+            print(f"Built {name} snapshot from {manifest[name]['source']['path']}")
+        else:
+            print(f"Skipped {name}: source file not found")
+    print(f"Wrote {os.path.join(args.out, MANIFEST_NAME)}")
@@ -0,0 +1,119 @@
+import base64
+import hashlib
+import os
+import threading
+
+import streamlit as st
+
+import logo_variants
+from asset_cache import ASSET_CACHE
+
+
+# Streamlit serves <app dir>/static at app/static when server.enableStaticServing is on
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+URL_PREFIX = 'app/static'
+
+# (absolute path, mtime) -> published URL, so a rerun doesn't re-hash unchanged files
+_published = {}
+_lock = threading.Lock()
+
+
+def enabled():
+    """Whether images should be referenced by URL instead of inlined as base64"""
+    try:
+        return bool(st.get_option('server.enableStaticServing'))
+    except Exception:
+        return False
+
+
+def fingerprinted_name(name, data):
+    """File name with a content hash, so a URL never changes meaning and can be cached forever"""
+    stem, ext = os.path.splitext(name)
+    return f'{stem}.{hashlib.sha1(data).hexdigest()[:12]}{ext}'
+
+
+def publish_bytes(data, name):
+    """Write bytes into the static directory under a fingerprinted name and return their URL"""
+    filename = fingerprinted_name(name, data)
+    target = os.path.join(STATIC_DIR, filename)
+    if not os.path.exists(target):
+        os.makedirs(STATIC_DIR, exist_ok=True)
+        tmp_path = f'{target}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+    return f'{URL_PREFIX}/{filename}'
+
+
+def prune(prefix, keep_prefix):
+    """Delete published files whose names start with prefix but not keep_prefix; returns how many"""
+    if not os.path.isdir(STATIC_DIR):
+        return 0
+    removed = 0
+    for name in os.listdir(STATIC_DIR):
+        if name.startswith(prefix) and not name.startswith(keep_prefix):
+            try:
+                os.remove(os.path.join(STATIC_DIR, name))
+                removed += 1
+            except OSError:
+                # Already removed by another process
+                continue
+    return removed
+
+
+def url_for(path):
+    """Published URL for a file on disk; raises OSError if it can't be read"""
+    key = (os.path.abspath(path), os.stat(path).st_mtime_ns)
+    with _lock:
+        url = _published.get(key)
+    if url is None:
+        with open(path, 'rb') as f:
+            url = publish_bytes(f.read(), os.path.basename(path))
+        with _lock:
+            _published[key] = url
+    return url
+
+
+def file_src(image_path, height, search_dirs=()):
+    """<img src> for an image file shown in a slot `height` px tall, or "" if it can't be read
+
+    Uses the smallest prebuilt variant that fits. In static mode this is a fingerprinted
+    app/static URL, otherwise an inline data URI. search_dirs are extra directories to
+    look for the original image in.
+    """
+    variant = logo_variants.best_variant(image_path, height)
+    if enabled():
+        try:
+            return url_for(variant[0] if variant else image_path)
+        except OSError:
+            pass
+    if variant:
+        path, mime = variant
+        try:
+            return f"data:{mime};base64,{ASSET_CACHE.get_base64(path)}"
+        except OSError:
+            pass
+    for path in (image_path, *(os.path.join(d, image_path) for d in search_dirs)):
+        try:
+            return f"data:image/png;base64,{ASSET_CACHE.get_base64(path)}"
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"Could not load image {path}: {e}")
+            break
+    return ""
+
+
+def data_uri(data, mime):
+    """Inline data URI for image bytes"""
+    return f"data:{mime};base64,{base64.b64encode(data).decode()}"
+
+
+def image_src(data, name, mime):
+    """<img src> for generated image bytes: a static URL in static mode, else a data URI"""
+    if enabled():
+        try:
+            return publish_bytes(data, name)
+        except OSError as e:
+            print(f"Could not publish {name}, inlining instead: {e}")
+    return data_uri(data, mime)
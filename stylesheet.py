@@ -0,0 +1,43 @@
+import os
+import re
+import threading
+
+
+# Stylesheet sources, one file per bundle: app.css is global, page bundles only add overrides.
+# The minified CSS is inlined on every full rerun, since Streamlit drops any element a rerun
+# doesn't re-emit: about 8.6 KB for app.css, plus about 1 KB on the recruitment page.
+STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles')
+
+# bundle name -> (source mtime, <style> tag)
+_tags = {}
+_lock = threading.Lock()
+
+
+def minify(css):
+    """Drop comments and the whitespace the browser doesn't need"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+
+def style_tag(bundle):
+    """<style> tag holding a stylesheet bundle's minified CSS, rebuilt when the source changes
+
+    Always inlined: the static file handler of the older Streamlit releases requirements.txt
+    allows serves .css as text/plain with nosniff, which browsers refuse to apply.
+    """
+    path = os.path.join(STYLES_DIR, f'{bundle}.css')
+    mtime = os.stat(path).st_mtime_ns
+    with _lock:
+        cached = _tags.get(bundle)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path) as f:
+        tag = f'<style>{minify(f.read())}</style>'
+
+    with _lock:
+        _tags[bundle] = (mtime, tag)
+    return tag
@@ -0,0 +1,117 @@
+"""Canonical team ids, their aliases and logo files.
+
+Usage:
+    python team_logos.py   # report teams in the data files that have no logo
+"""
+import json
+import os
+
+
+# Canonical team id -> logo file and every name the data sources use for the team
+TEAM_LOGOS = {
+    'afc-wimbledon': {'file': 'wimbledon.png', 'aliases': ['Wimbledon', 'AFC Wimbledon']},
+    'barnsley': {'file': 'barnsley.png', 'aliases': ['Barnsley']},
+    'blackpool': {'file': 'blackpool.png', 'aliases': ['Blackpool']},
+    'bolton-wanderers': {'file': 'bolton.png', 'aliases': ['Bolton', 'Bolton Wanderers']},
+    'bradford-city': {'file': 'bradford.png', 'aliases': ['Bradford', 'Bradford City']},
+    'burton-albion': {'file': 'burton.png', 'aliases': ['Burton', 'Burton Albion']},
+    'cardiff-city': {'file': 'cardiff.png', 'aliases': ['Cardiff', 'Cardiff City']},
+    'doncaster-rovers': {'file': 'doncaster.png', 'aliases': ['Doncaster', 'Doncaster Rovers']},
+    'exeter-city': {'file': 'exeter.png', 'aliases': ['Exeter', 'Exeter City']},
+    'huddersfield-town': {'file': 'huddersfield.png', 'aliases': ['Huddersfield', 'Huddersfield Town']},
+    'leyton-orient': {'file': 'leytonorient.png', 'aliases': ['Leyton Orient']},
+    'lincoln-city': {'file': 'lincoln.png', 'aliases': ['Lincoln', 'Lincoln City']},
+    'luton-town': {'file': 'luton.png', 'aliases': ['Luton', 'Luton Town']},
+    'mansfield-town': {'file': 'mansfield.png', 'aliases': ['Mansfield', 'Mansfield Town']},
+    'northampton-town': {'file': 'northampton.png', 'aliases': ['Northampton', 'Northampton Town']},
+    'peterborough-united': {'file': 'peterborough.png', 'aliases': ['Peterborough', 'Peterborough United']},
+    'plymouth-argyle': {'file': 'plymouth.png', 'aliases': ['Plymouth', 'Plymouth Argyle']},
+    'port-vale': {'file': 'portvale.png', 'aliases': ['Port Vale']},
+    'reading': {'file': 'reading.png', 'aliases': ['Reading']},
+    'rotherham-united': {'file': 'rotherham.png', 'aliases': ['Rotherham', 'Rotherham United']},
+    'stevenage': {'file': 'stevenage.png', 'aliases': ['Stevenage']},
+    'stockport-county': {'file': 'stockport.png', 'aliases': ['Stockport', 'Stockport County']},
+    'wigan-athletic': {'file': 'wigan.png', 'aliases': ['Wigan', 'Wigan Athletic']},
+    'wycombe-wanderers': {'file': 'wycombe.png', 'aliases': ['Wycombe', 'Wycombe Wanderers']},
+    'yeovil-town': {'file': 'yeovil.png', 'aliases': ['Yeovil', 'Yeovil Town']},
+}
+
+# Where logo files are looked for, in order (deployment first, then the local checkout)
+LOGO_DIRS = ['.', '/Users/as/Personal projects/wigan']
+
+
+def normalize(name):
+    """Case- and whitespace-insensitive key for matching team names"""
+    return ' '.join(name.lower().split())
+
+
+class LogoManifest:
+    """Team name -> logo path, resolved against the filesystem once when built"""
+
+    def __init__(self, team_logos=TEAM_LOGOS, logo_dirs=LOGO_DIRS):
+        self.paths = {}
+        self.missing_files = []
+        for team_id, entry in team_logos.items():
+            path = next(
+                (os.path.join(d, entry['file']) for d in logo_dirs
+                 if os.path.exists(os.path.join(d, entry['file']))),
+                None
+            )
+            if path is None:
+                self.missing_files.append(entry['file'])
+                continue
+            self.paths[team_id] = os.path.normpath(path)
+
+        self.aliases = {}
+        for team_id, entry in team_logos.items():
+            for name in [team_id] + entry['aliases']:
+                self.aliases[normalize(name)] = team_id
+
+        self._validated = set()
+
+    def team_id(self, team_name):
+        """Canonical id for any known name of a team, or None"""
+        return self.aliases.get(normalize(team_name))
+
+    def logo_for(self, team_name):
+        """Logo path for a team, or None if it has no logo"""
+        return self.paths.get(self.team_id(team_name))
+
+    def missing(self, team_names):
+        """Team names from the data that don't resolve to a logo file"""
+        return sorted({name for name in team_names if self.logo_for(name) is None})
+
+    def validate(self, team_names, source='data'):
+        """Warn once per team list about teams without a logo; returns the missing names"""
+        missing = self.missing(team_names)
+        key = (source, tuple(sorted(team_names)))
+        if missing and key not in self._validated:
+            print(f"No logo for {len(missing)} team(s) in {source}: {', '.join(missing)}")
+        self._validated.add(key)
+        return missing
+
+
+# Built once per process, at import
+LOGO_MANIFEST = LogoManifest()
+
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    if LOGO_MANIFEST.missing_files:
+        print(f"Logo files not found: {', '.join(LOGO_MANIFEST.missing_files)}")
+
+    sources = {}
+    if os.path.exists('leagueone.csv'):
+        sources['leagueone.csv'] = pd.read_csv('leagueone.csv', usecols=['Team'])['Team'].tolist()
+    if os.path.exists('players.csv'):
+        sources['players.csv'] = pd.read_csv('players.csv', usecols=['team_name'])['team_name'].unique().tolist()
+    if os.path.exists('team_stats.json'):
+        with open('team_stats.json') as f:
+            sources['team_stats.json'] = [team['team'] for team in json.load(f)['teams']]
+
+    for source, names in sources.items():
+        missing = LOGO_MANIFEST.missing(names)
+        print(f"{source}: {len(names) - len(missing)}/{len(names)} teams have a logo")
+        for name in missing:
+            print(f"  missing: {name}")
@@ -0,0 +1,167 @@
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from metric_registry import DERIVED_METRICS, is_lower_better
+
+
+# One team's full row, and a slice of its metrics; arrays are views into the store
+TeamRecord = namedtuple('TeamRecord', ['team', 'values', 'percentiles', 'ranks'])
+MetricSlice = namedtuple('MetricSlice', ['metrics', 'values', 'percentiles', 'ranks'])
+
+
+def rank_matrix(values, lower_is_better):
+    """League rank (1 = best) of every row in every column via one stable argsort"""
+    signed = np.where(lower_is_better, values, -values)
+    order = np.argsort(signed, axis=0, kind='stable')
+    ranks = np.empty(values.shape, dtype=np.int64)
+    positions = np.broadcast_to(np.arange(1, values.shape[0] + 1)[:, None], values.shape)
+    np.put_along_axis(ranks, order, positions, axis=0)
+    return ranks
+
+
+def percentile_matrix(values, lower_is_better):
+    """Percentile (0-100) of every row in every column, flipping lower-is-better columns"""
+    signed = np.where(lower_is_better, -values, values)
+    return pd.DataFrame(signed).rank(pct=True).to_numpy() * 100
+
+
+class TeamStore:
+    """Columnar team stats: a teams x metrics value matrix plus a matching percentile matrix"""
+
+    def __init__(self, teams, metrics, values, version=None, percentiles=None, ranks=None):
+        self.teams = list(teams)
+        self.metrics = list(metrics)
+        self.values = values
+
+        # Identifies the data this store was built from; derived columns are memoized per version
+        self.version = version if version is not None else self.fingerprint(self.teams, self.metrics, values)
+
+        # Name -> row/column maps so lookups never scan the matrices
+        self.team_index = {name: i for i, name in enumerate(self.teams)}
+        self.metric_index = {name: j for j, name in enumerate(self.metrics)}
+
+        # Percentiles and rank order for every metric, computed once so render-time lookups are O(1)
+        # A prebuilt snapshot passes them in (memory-mapped) instead
+        if percentiles is None or ranks is None:
+            lower_is_better = np.array([is_lower_better(m) for m in self.metrics], dtype=bool)
+            percentiles = percentile_matrix(values, lower_is_better)
+            ranks = rank_matrix(values, lower_is_better)
+        self.percentiles = percentiles
+        self.ranks = ranks
+
+        # Derived metric name -> (values, percentiles, ranks), filled on first use
+        self._derived = {}
+
+    @staticmethod
+    def fingerprint(teams, metrics, values):
+        """Content hash of the store's inputs"""
+        digest = hashlib.sha1()
+        digest.update('\x1f'.join(teams).encode())
+        digest.update('\x1f'.join(metrics).encode())
+        digest.update(np.ascontiguousarray(values).tobytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def empty(cls):
+        """Store with no teams, used when the source file can't be read"""
+        return cls([], [], np.empty((0, 0)))
+
+    @classmethod
+    def from_dataframe(cls, df, team_column='Team', version=None):
+        """Build the store from a one-row-per-team DataFrame"""
+        metrics = [
+            col for col in df.columns
+            if col != team_column and pd.api.types.is_numeric_dtype(df[col])
+        ]
+        values = df[metrics].to_numpy(dtype=np.float64)
+        return cls(df[team_column].tolist(), metrics, values, version=version)
+
+    def __len__(self):
+        return len(self.teams)
+
+    def has_metric(self, metric):
+        """Whether a metric is stored or can be derived from stored columns"""
+        if metric in self.metric_index:
+            return True
+        if metric not in DERIVED_METRICS:
+            return False
+        try:
+            self.derived(metric)
+        except KeyError:
+            return False
+        return True
+
+    def derived(self, metric):
+        """Values, percentiles and ranks of a derived metric, computed once per data version"""
+        if metric not in self._derived:
+            spec = DERIVED_METRICS[metric]
+            values = np.asarray(spec.formula(self._base_column), dtype=np.float64)[:, None]
+            self._derived[metric] = (
+                values[:, 0],
+                percentile_matrix(values, spec.lower_is_better)[:, 0],
+                rank_matrix(values, spec.lower_is_better)[:, 0]
+            )
+        return self._derived[metric]
+
+    def get_team(self, team):
+        """Full record for a team via the hash index, or None if unknown"""
+        row = self.team_index.get(team)
+        if row is None:
+            return None
+        return TeamRecord(team, self.values[row], self.percentiles[row], self.ranks[row])
+
+    def get_metrics(self, team, metrics):
+        """Values, percentiles and ranks for a list of metrics in a single indexed read
+
+        Metrics that are neither stored nor derivable are skipped; returns None if the team is unknown.
+        """
+        row = self.team_index.get(team)
+        if row is None:
+            return None
+        present = [m for m in metrics if self.has_metric(m)]
+        if all(m in self.metric_index for m in present):
+            cols = [self.metric_index[m] for m in present]
+            return MetricSlice(
+                present,
+                self.values[row, cols],
+                self.percentiles[row, cols],
+                self.ranks[row, cols]
+            )
+
+        # Mixed stored and derived metrics: gather each column's entry for this team
+        columns = [self._columns(m) for m in present]
+        return MetricSlice(
+            present,
+            np.array([c[0][row] for c in columns], dtype=np.float64),
+            np.array([c[1][row] for c in columns], dtype=np.float64),
+            np.array([c[2][row] for c in columns], dtype=np.int64)
+        )
+
+    def value(self, team, metric):
+        """Raw value of a metric for a team"""
+        return self._columns(metric)[0][self.team_index[team]]
+
+    def percentile(self, team, metric):
+        """League percentile (0-100) of a metric for a team"""
+        return self._columns(metric)[1][self.team_index[team]]
+
+    def rank(self, team, metric):
+        """League rank (1 = best) of a team for a stored or derived metric"""
+        return int(self._columns(metric)[2][self.team_index[team]])
+
+    def column(self, metric):
+        """Values of a metric for every team, in row order"""
+        return self._columns(metric)[0]
+
+    def _base_column(self, metric):
+        return self.values[:, self.metric_index[metric]]
+
+    def _columns(self, metric):
+        """(values, percentiles, ranks) columns for a stored or derived metric"""
+        col = self.metric_index.get(metric)
+        if col is None:
+            return self.derived(metric)
+        return self.values[:, col], self.percentiles[:, col], self.ranks[:, col]
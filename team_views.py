@@ -0,0 +1,56 @@
+import functools
+import threading
+import time
+from collections import namedtuple
+
+from data_cache import VersionedCache
+
+
+# Everything the Opposition Research page shows for one team, ready to hand to Streamlit:
+# logo <img src>, stat card HTML (ranks, values and colors baked in), a bar chart spec per
+# section and, for the combined layout, the 2x2 figure spec
+TeamView = namedtuple('TeamView', ['logo', 'stat_cards', 'section_figures', 'combined_figure'])
+
+# Views keyed by team for the current team data; shared by every session
+TEAM_VIEWS = VersionedCache()
+
+# Data versions a warm-up has been started for, so each version is only built once
+_warmed = set()
+_lock = threading.Lock()
+
+
+def warm(version, teams, build, is_current):
+    """Build every team's view for `version` on a background thread, once per data version
+
+    build(team) returns the team's TeamView. is_current() is checked between teams so a
+    warm-up for data that has since been replaced stops instead of evicting the new views.
+    Returns the thread, or None if this version is already warm (or warming).
+    """
+    with _lock:
+        if version is None or version in _warmed:
+            return None
+        _warmed.add(version)
+
+    thread = threading.Thread(
+        target=_warm_all, args=(version, list(teams), build, is_current),
+        name=f"team-views:{version[:12]}", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def _warm_all(version, teams, build, is_current):
+    start = time.perf_counter()
+    built = 0
+    for team in teams:
+        if not is_current():
+            print(f"Stopped warming team views for version {version[:12]}: data changed")
+            return
+        try:
+            TEAM_VIEWS.get_or_build(version, team, functools.partial(build, team))
+            built += 1
+        except Exception as e:
+            # Left for the request path to build (and report) on first visit
+            print(f"Could not prebuild the {team} view: {e}")
+    print(f"Warmed {built}/{len(teams)} team views for version {version[:12]} "
+          f"in {time.perf_counter() - start:.2f}s")
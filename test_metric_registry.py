@@ -0,0 +1,50 @@
+import csv
+import os
+
+from metric_registry import XG_DIFFERENCE, is_lower_better
+
+
+TEAMS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'leagueone.csv')
+
+# Team stats where a lower value is better; every other team stat is higher-is-better
+TEAM_LOWER_IS_BETTER = {
+    'PPDA',
+    'Total losses', 'Low losses', 'Med Losses', 'High losses',
+    'Conceded goals', 'Total shots against', 'SOT against', 'SOT against %',
+    'Offsides', 'Fouls', 'Yellow cards', 'Red cards',
+    'Average shot distance',
+}
+
+
+def csv_metrics():
+    with open(TEAMS_CSV, newline='') as f:
+        header = next(csv.reader(f))
+    return [column for column in header if column != 'Team']
+
+
+def intended_lower_is_better(metric):
+    """An opponent stat ranks the opposite way to the same stat for the team"""
+    if metric.startswith('Oppo '):
+        return not intended_lower_is_better(metric[len('Oppo '):])
+    return metric in TEAM_LOWER_IS_BETTER
+
+
+def test_every_csv_metric_has_its_intended_direction():
+    wrong = [metric for metric in csv_metrics()
+             if is_lower_better(metric) != intended_lower_is_better(metric)]
+    assert wrong == []
+
+
+def test_every_opponent_stat_mirrors_a_team_stat():
+    metrics = set(csv_metrics())
+    unpaired = [metric for metric in metrics
+                if metric.startswith('Oppo ') and metric[len('Oppo '):] not in metrics]
+    assert unpaired == []
+
+
+def test_team_lower_is_better_names_real_columns():
+    assert TEAM_LOWER_IS_BETTER - set(csv_metrics()) == set()
+
+
+def test_xg_difference_is_higher_is_better():
+    assert not is_lower_better(XG_DIFFERENCE)